@@ -9,16 +9,45 @@ and exposes a simple ``main`` runner that can be invoked via ``python main.py``.
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, List
 
-from src.agents.ingestion_agent import ingest_file_from_path, list_input_files
-from src.core.logging_utils import configure_run_logger
+from src.agents.ingestion_agent import (
+    DefaultIngestExecutor,
+    IngestExecutor,
+    ingest_file_from_path,
+    list_input_files,
+)
+from src.core.file_cache import FileEntryCache
+from src.core.logging_utils import SUMMARY_LOGGER_NAME, configure_run_logger
 
+SUMMARY_FIELDS = ("file_id", "name", "extension", "size_bytes")
 
-def run_ingestion(input_dir: Path) -> List[Dict[str, object]]:
-    """Run the ingestion sequence for every supported file in ``input_dir``."""
+
+def _format_summary_table(ingested_files: List[Dict[str, object]]) -> str:
+    """Render the ingested files as a fixed-width text table."""
+    rows = [[str(file_info[field]) for field in SUMMARY_FIELDS] for file_info in ingested_files]
+    widths = [max(len(field), *(len(row[index]) for row in rows)) for index, field in enumerate(SUMMARY_FIELDS)]
+    lines = [SUMMARY_FIELDS, *rows]
+    return "\n".join("  ".join(value.ljust(width) for value, width in zip(line, widths)).rstrip() for line in lines)
+
+
+def run_ingestion(
+    input_dir: Path,
+    cache: FileEntryCache | None = None,
+    include_content: bool = True,
+    executor: IngestExecutor | None = None,
+) -> List[Dict[str, object]]:
+    """Run the ingestion sequence for every supported file in ``input_dir``.
+
+    With a *cache*, unchanged files keep their ``file_id``. With
+    ``include_content=False`` no file content is loaded at all. File I/O runs
+    on *executor*'s thread pool; a ``DefaultIngestExecutor`` is created if omitted.
+    """
     logging.info("Starting ingestion run for directory: %s", input_dir)
     ingested_results: List[Dict[str, object]] = []
 
@@ -28,10 +57,17 @@ def run_ingestion(input_dir: Path) -> List[Dict[str, object]]:
         logging.warning("No eligible files found in %s", input_dir)
         return ingested_results
 
-    # Process each file sequentially so log output stays easy to read.
-    for file_path in files:
-        logging.info("Ingesting %s", file_path)
-        ingested_results.append(ingest_file_from_path(file_path))
+    # Ingest files concurrently; ``map`` keeps results in submission order.
+    # Each entry carries the stat result from the listing, saving a second lookup.
+    with nullcontext(executor) if executor is not None else DefaultIngestExecutor() as active_executor:
+        logging.info("Ingesting %d file(s) on the I/O thread pool.", len(files))
+        ingested_results = list(
+            active_executor.thread_executor.map(
+                functools.partial(ingest_file_from_path, cache=cache, include_content=include_content),
+                [file_entry.path_str for file_entry in files],
+                [file_entry.stat_result for file_entry in files],
+            )
+        )
 
     logging.info("Completed ingestion run. %d file(s) processed.", len(ingested_results))
     return ingested_results
@@ -43,21 +79,24 @@ def main() -> None:
     log_file = configure_run_logger(app_name="cli_ingestion")
     logging.info("CLI logging initialised. Run log file: %s", log_file)
 
+    # The CLI only reports metadata, so it skips loading file content entirely.
+    cache = FileEntryCache.load()
     try:
-        ingested_files = run_ingestion(input_dir)
+        ingested_files = run_ingestion(input_dir, cache=cache, include_content=False)
     except (FileNotFoundError, NotADirectoryError) as exc:
         logging.error("Ingestion failed: %s", exc)
         return
+    cache.save()
 
-    # Mirror ingestion summaries after the run completes.
-    for file_info in ingested_files:
-        logging.info(
-            "Ingested file '%s' (%s) with id=%s size=%d bytes",
-            file_info["name"],
-            file_info["extension"],
-            file_info["file_id"],
-            file_info["size_bytes"],
-        )
+    if not ingested_files:
+        return
+
+    # Mirror ingestion summaries after the run completes as one record per sink,
+    # instead of one log call per file.
+    logging.info("Ingestion summary:\n%s", _format_summary_table(ingested_files))
+    logging.getLogger(SUMMARY_LOGGER_NAME).info(
+        "\n".join(json.dumps({field: file_info[field] for field in SUMMARY_FIELDS}) for file_info in ingested_files)
+    )
 
 
 if __name__ == "__main__":
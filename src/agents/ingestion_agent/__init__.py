@@ -1,3 +1,22 @@
-from .ingestion_agent import DEFAULT_ALLOWED_EXTENSIONS, ingest_file_from_path, list_input_files
+from .executors import DefaultIngestExecutor, IngestExecutor
+from .ingestion_agent import (
+    DEFAULT_ALLOWED_EXTENSIONS,
+    LAZY_CONTENT_THRESHOLD_BYTES,
+    FileEntry,
+    LazyFileContent,
+    ingest_file_from_path,
+    ingest_file_metadata,
+    list_input_files,
+)
 
-__all__ = ["list_input_files", "ingest_file_from_path", "DEFAULT_ALLOWED_EXTENSIONS"]
+__all__ = [
+    "list_input_files",
+    "ingest_file_from_path",
+    "ingest_file_metadata",
+    "FileEntry",
+    "LazyFileContent",
+    "IngestExecutor",
+    "DefaultIngestExecutor",
+    "DEFAULT_ALLOWED_EXTENSIONS",
+    "LAZY_CONTENT_THRESHOLD_BYTES",
+]
@@ -0,0 +1,88 @@
+# -----------------------------------------------------------------------------
+# AI Doc Agent - executor plumbing for I/O- and CPU-bound ingestion stages.
+# -----------------------------------------------------------------------------
+"""
+Executors used to parallelize ingestion. File I/O (stat, read) runs on a
+thread pool, while CPU-heavy stages such as parsing or chunking should be routed
+to a process pool so they scale with cores instead of contending on the GIL.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+# Worker-count knobs; ``INGEST_N_THREADS`` is still honoured as a fallback for I/O threads.
+INGEST_IO_THREADS_ENV = "INGEST_IO_THREADS"
+INGEST_N_THREADS_ENV = "INGEST_N_THREADS"
+INGEST_CPU_WORKERS_ENV = "INGEST_CPU_WORKERS"
+
+
+class IngestExecutor(Protocol):
+    """Pair of executors: threads for I/O-bound work, processes for CPU-bound work."""
+
+    @property
+    def thread_executor(self) -> Executor: ...
+
+    @property
+    def process_executor(self) -> Executor: ...
+
+
+def resolve_worker_count(*env_names: str, default: int) -> int:
+    """Return the first valid positive integer among *env_names*, or *default*."""
+    for env_name in env_names:
+        raw_value = os.getenv(env_name)
+        if raw_value is None:
+            continue
+        try:
+            return max(1, int(raw_value))
+        except ValueError:
+            logger.warning("Ignoring invalid %s=%r.", env_name, raw_value)
+    return default
+
+
+class DefaultIngestExecutor:
+    """Thread pool for I/O plus a process pool that is only started when first used.
+
+    Use as a context manager so both pools are shut down once the run finishes.
+    """
+
+    def __init__(self, io_threads: int | None = None, cpu_workers: int | None = None) -> None:
+        cpu_count = os.cpu_count() or 4
+        self.io_threads = io_threads or resolve_worker_count(
+            INGEST_IO_THREADS_ENV, INGEST_N_THREADS_ENV, default=cpu_count
+        )
+        self.cpu_workers = cpu_workers or resolve_worker_count(INGEST_CPU_WORKERS_ENV, default=cpu_count)
+        self._thread_executor = ThreadPoolExecutor(max_workers=self.io_threads, thread_name_prefix="ingest-io")
+        self._process_executor: ProcessPoolExecutor | None = None
+        logger.info(
+            "Ingestion executor ready: %d I/O thread(s), up to %d CPU worker(s).", self.io_threads, self.cpu_workers
+        )
+
+    @property
+    def thread_executor(self) -> Executor:
+        return self._thread_executor
+
+    @property
+    def process_executor(self) -> Executor:
+        # Spawning worker processes is expensive, so defer it until a CPU stage needs one.
+        if self._process_executor is None:
+            logger.debug("Starting ingestion process pool with %d worker(s).", self.cpu_workers)
+            self._process_executor = ProcessPoolExecutor(max_workers=self.cpu_workers)
+        return self._process_executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the thread pool and, if it was started, the process pool."""
+        self._thread_executor.shutdown(wait=wait)
+        if self._process_executor is not None:
+            self._process_executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "DefaultIngestExecutor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
@@ -10,10 +10,20 @@ metadata-rich dictionary.
 
 from __future__ import annotations
 
+import itertools
 import logging
-import uuid
+import mmap
+import os
+import secrets
+import stat
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from src.core.file_cache import FileEntryCache
 
 # Module-level logger so callers can integrate with their logging setup.
 logger = logging.getLogger(__name__)
@@ -21,91 +31,332 @@ logger = logging.getLogger(__name__)
 # Extensions that should be picked up when the caller does not provide a custom list.
 DEFAULT_ALLOWED_EXTENSIONS: tuple[str, ...] = ("pdf", "txt", "docx", "csv", "xlsx")
 
+# Normalized form of the defaults, computed once so listings can reuse it directly.
+_DEFAULT_NORMALIZED_EXTS: frozenset[str] = frozenset(ext.lstrip(".").lower() for ext in DEFAULT_ALLOWED_EXTENSIONS)
+
+# Files larger than this get a lazy content handle instead of being read eagerly.
+LAZY_CONTENT_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+# File ids are persisted by the file cache, so they must not repeat across processes:
+# a 32-bit random per-process prefix plus a counter avoids a ``getrandom`` call per
+# file and is safe to share across threads.
+_FILE_ID_PREFIX = secrets.token_hex(4)
+_FILE_ID_COUNTER = itertools.count()
+
+
+@dataclass(frozen=True)
+class FileEntry:
+    """A file discovered by ``list_input_files`` along with its cached ``stat`` result.
+
+    Paths are kept as plain strings from ``os.DirEntry``; ``path`` builds a
+    ``Path`` only for callers that need one.
+    """
+
+    path_str: str
+    name: str
+    extension: str
+    stat_result: os.stat_result
+
+    @property
+    def path(self) -> Path:
+        return Path(self.path_str)
+
+
+def _extension_of(name: str) -> str:
+    """Return the lowercased extension of *name* without the dot, like ``Path.suffix``."""
+    # A leading dot marks a hidden file rather than an extension.
+    dot = name.rfind(".")
+    return name[dot + 1 :].lower() if dot > 0 else ""
+
+
+# Listings keyed by (directory, allowed extensions) -> (directory mtime_ns, entries).
+# A directory's mtime only changes when entries are added, removed, or renamed.
+_LIST_CACHE: Dict[Tuple[str, frozenset[str]], Tuple[int, List[FileEntry]]] = {}
+
+# Directory mtimes advance on a coarse clock tick, so an entry created in the same tick
+# as a scan leaves the mtime unchanged. Listings of directories modified this recently
+# before the scan are not cached (the "racy mtime" case git handles for its index).
+_RACY_MTIME_WINDOW_NS = 1_000_000_000
+
+
+def _refresh_cached_listing(entries: List[FileEntry]) -> List[FileEntry] | None:
+    """Re-stat cached entries, returning ``None`` if any is no longer a regular file.
+
+    Overwriting a file in place leaves the directory mtime untouched, so sizes must
+    still be refreshed; this skips the directory scan but not the per-file ``stat``.
+    """
+    refreshed: List[FileEntry] = []
+    for file_entry in entries:
+        try:
+            stat_result = os.stat(file_entry.path_str)
+        except FileNotFoundError:
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+        refreshed.append(replace(file_entry, stat_result=stat_result))
+    return refreshed
+
+
+def _sorted_by_path(entries: List[FileEntry]) -> List[FileEntry]:
+    """Return *entries* ordered by path string."""
+    return sorted(entries, key=lambda file_entry: file_entry.path_str)
+
 
 def list_input_files(
     input_dir: Path,
     allowed_extensions: list[str] | None = None,
-) -> List[Path]:
-    """Return files inside *input_dir* matching the desired extensions."""
+    sort: bool = False,
+) -> List[FileEntry]:
+    """Return files inside *input_dir* matching the desired extensions.
+
+    Entries come back in directory scan order unless *sort* is set, in which case
+    they are ordered by path for deterministic display and testing.
+    """
     logger.info("Listing input files in directory: %s", input_dir)
 
-    # Validate that the directory exists before doing any additional work.
-    if not input_dir.exists():
+    # Validate that the directory exists before doing any additional work; the same
+    # stat result also provides the mtime used to reuse a previous listing.
+    try:
+        dir_stat = os.stat(input_dir)
+        scan_started_ns = time.time_ns()
+    except FileNotFoundError:
         logger.error("Input directory %s was not found.", input_dir)
-        raise FileNotFoundError(f"Input directory '{input_dir}' was not found.")
+        raise FileNotFoundError(f"Input directory '{input_dir}' was not found.") from None
 
     # Ensure that the provided path is actually a directory.
-    if not input_dir.is_dir():
+    if not stat.S_ISDIR(dir_stat.st_mode):
         logger.error("Path %s is not a directory.", input_dir)
         raise NotADirectoryError(f"'{input_dir}' is not a directory.")
 
-    # Use the defaults if the caller did not provide an explicit allow list.
-    allowed = allowed_extensions if allowed_extensions is not None else list(DEFAULT_ALLOWED_EXTENSIONS)
-    logger.debug("Allowed extensions resolved to: %s", allowed)
+    # Use the precomputed defaults if the caller did not provide an explicit allow list;
+    # otherwise normalize by stripping leading dots and forcing lowercase for comparisons.
+    if allowed_extensions is None:
+        normalized_exts = _DEFAULT_NORMALIZED_EXTS
+    else:
+        normalized_exts = frozenset(ext.lstrip(".").lower() for ext in allowed_extensions)
+    logger.debug("Allowed extensions resolved to: %s", sorted(normalized_exts))
 
-    # Normalize extensions by stripping leading dots and forcing lowercase for comparisons.
-    normalized_exts = {ext.lstrip(".").lower() for ext in allowed}
+    # Skip the scan entirely when the directory has not changed since the last listing.
+    cache_key = (os.path.abspath(input_dir), normalized_exts)
+    cached = _LIST_CACHE.get(cache_key)
+    if cached is not None and cached[0] == dir_stat.st_mtime_ns:
+        refreshed = _refresh_cached_listing(cached[1])
+        if refreshed is not None:
+            logger.info("Found %d eligible file(s) in %s (directory unchanged)", len(refreshed), input_dir)
+            return _sorted_by_path(refreshed) if sort else refreshed
 
-    matching_files: List[Path] = []
-    for file_path in input_dir.iterdir():
-        # Skip directories or anything that is not a file.
-        if not file_path.is_file():
-            logger.debug("Skipping non-file entry: %s", file_path)
-            continue
+    matching_files: List[FileEntry] = []
+    scanned_count = 0
+    skipped_non_file = 0
+    # Resolve the debug check once instead of paying for it on every entry.
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    # Bind hot-loop lookups to locals; large directories make these add up.
+    append = matching_files.append
+    exts = normalized_exts
+    # ``os.scandir`` exposes the file type from the directory listing itself, so we
+    # avoid a separate ``stat`` call per entry just to tell files from directories.
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            scanned_count += 1
 
-        # Extract and normalize the file's extension.
-        ext = file_path.suffix.lstrip(".").lower()
-        logger.debug("Evaluating file %s with extension %s", file_path, ext)
+            # Check the extension first: it is pure string work, while ``is_file`` may
+            # need a ``stat`` on some platforms. Same rules as ``_extension_of``.
+            name = entry.name
+            dot = name.rfind(".")
+            ext = name[dot + 1 :].lower() if dot > 0 else ""
+            if ext not in exts:
+                continue
 
-        # Keep only files that match one of the allowed extensions.
-        if ext in normalized_exts:
-            logger.info("Queued file for ingestion: %s", file_path)
-            matching_files.append(file_path)
-        else:
-            logger.debug("Skipping file %s due to unsupported extension.", file_path)
+            # Skip directories or anything that is not a file. Symlinks are followed, as
+            # ``Path.is_file`` did; regular files are still answered from ``d_type``.
+            if not entry.is_file():
+                skipped_non_file += 1
+                continue
 
-    # Sort for deterministic output, which helps during testing and logging comparisons.
-    ordered_files = sorted(matching_files)
-    logger.info("Found %d eligible file(s) in %s", len(ordered_files), input_dir)
-    return ordered_files
+            if debug_enabled:
+                logger.debug("Queued file for ingestion: %s", entry.path)
+            # Keep the stat result so ingestion does not need to stat the file again.
+            append(FileEntry(entry.path, name, ext, entry.stat()))
 
+    # Emit one aggregate record rather than a debug line per scanned entry.
+    logger.debug(
+        "Scan summary for %s: scanned=%d kept=%d skipped_nonfile=%d skipped_ext=%d",
+        input_dir,
+        scanned_count,
+        len(matching_files),
+        skipped_non_file,
+        scanned_count - len(matching_files) - skipped_non_file,
+    )
 
-def ingest_file_from_path(path: Path) -> Dict[str, object]:
-    """Read a local file path and return a normalized ingestion dictionary."""
-    logger.info("Ingesting file at path: %s", path)
+    # Only trust the listing later if the directory was last modified well before the scan.
+    if dir_stat.st_mtime_ns < scan_started_ns - _RACY_MTIME_WINDOW_NS:
+        _LIST_CACHE[cache_key] = (dir_stat.st_mtime_ns, matching_files)
+    else:
+        _LIST_CACHE.pop(cache_key, None)
+    logger.info("Found %d eligible file(s) in %s", len(matching_files), input_dir)
+    # Only sort on request; the ingestion path does not depend on ordering.
+    return _sorted_by_path(matching_files) if sort else list(matching_files)
+
+
+def _read_file_bytes(path: str, size: int) -> bytes:
+    """Read *size* bytes from *path* with raw descriptor calls.
+
+    ``Path.read_bytes`` goes through the buffered IO stack, which issues its own
+    ``fstat`` and an extra probing ``read``. Since the caller already knows the
+    size, we open the descriptor directly and usually finish in a single ``read``.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0))
+    try:
+        chunk = os.read(fd, size)
+        if len(chunk) == size or not chunk:
+            return chunk
 
-    # Confirm the target path exists on disk.
-    if not path.exists():
-        logger.error("File %s does not exist.", path)
-        raise FileNotFoundError(f"File '{path}' does not exist.")
+        # Short reads can happen on some filesystems; keep going until EOF or *size*.
+        chunks = [chunk]
+        remaining = size - len(chunk)
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+@dataclass(frozen=True)
+class LazyFileContent:
+    """On-demand access to a large file's payload.
+
+    Holds only the path and expected size, so keeping many results alive costs no
+    memory or file descriptors. ``read`` loads the bytes; ``mapped`` yields a
+    read-only ``mmap`` that is closed when the ``with`` block exits.
+    """
+
+    path: str
+    size: int
+
+    def read(self) -> bytes:
+        return _read_file_bytes(self.path, self.size)
+
+    def __bytes__(self) -> bytes:
+        return self.read()
+
+    @contextmanager
+    def mapped(self) -> Iterator[mmap.mmap]:
+        with open(self.path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            yield view
+
+
+def _load_content(path: str, size: int) -> bytes | LazyFileContent:
+    """Return the payload for *path*, deferring files above ``LAZY_CONTENT_THRESHOLD_BYTES``."""
+    if size <= LAZY_CONTENT_THRESHOLD_BYTES:
+        return _read_file_bytes(path, size)
+
+    logger.debug("Deferring content load for %s (%d bytes).", path, size)
+    return LazyFileContent(path, size)
+
+
+def _build_metadata(
+    path: str,
+    stat_result: os.stat_result | None,
+    cache: FileEntryCache | None,
+) -> Tuple[Dict[str, object], os.stat_result]:
+    """Validate *path* and return its ingestion dictionary plus the stat result used."""
+    # Confirm the target path exists on disk, reusing the caller's stat when available.
+    if stat_result is None:
+        try:
+            stat_result = os.stat(path)
+        except FileNotFoundError:
+            logger.error("File %s does not exist.", path)
+            raise FileNotFoundError(f"File '{path}' does not exist.") from None
 
     # Ensure we were given a regular file instead of a directory.
-    if not path.is_file():
+    if not stat.S_ISREG(stat_result.st_mode):
         logger.error("Path %s is not a file.", path)
         raise IsADirectoryError(f"'{path}' is not a file.")
 
-    # Read the content to memory; downstream processes may turn bytes into chunks.
-    content_bytes = path.read_bytes()
-
     # Compute metadata up front to avoid repeated filesystem calls later.
-    extension = path.suffix.lstrip(".").lower()
-    file_stat = path.stat()
+    name = os.path.basename(path)
+    extension = _extension_of(name)
     logger.debug(
         "File metadata - name: %s, extension: %s, size_bytes: %d",
-        path.name,
+        name,
         extension,
-        file_stat.st_size,
+        stat_result.st_size,
     )
 
-    # Compose the ingestion dictionary with a short UUID for traceability.
-    ingestion_result = {
-        "file_id": f"F-{uuid.uuid4().hex[:8]}",
-        "name": path.name,
+    # Reuse the cached id for files whose mtime and size have not changed.
+    cached = cache.lookup(path, stat_result) if cache is not None else None
+    if cached is not None:
+        logger.debug("File %s unchanged since %s; reusing cached id.", path, cached["last_ingested_at"])
+        file_id = str(cached["file_id"])
+    else:
+        file_id = f"F-{_FILE_ID_PREFIX}{next(_FILE_ID_COUNTER):06x}"
+
+    # Compose the ingestion dictionary.
+    return {
+        "file_id": file_id,
+        "name": name,
         "extension": extension,
         "source": "local_folder",
-        "path": str(path),
-        "size_bytes": file_stat.st_size,
-        "content_bytes": content_bytes,
-    }
+        "path": path,
+        "size_bytes": stat_result.st_size,
+        "unchanged": cached is not None,
+    }, stat_result
+
+
+def ingest_file_metadata(
+    path: str | Path,
+    stat_result: os.stat_result | None = None,
+    cache: FileEntryCache | None = None,
+) -> Dict[str, object]:
+    """Return the normalized ingestion dictionary for *path* without its content.
+
+    Callers that already hold a ``stat`` result for *path* (e.g. from
+    ``list_input_files``) can pass it via *stat_result* to skip a second lookup.
+    When a *cache* is given, unchanged files keep their previous ``file_id`` and
+    the result's ``unchanged`` flag is set. The cache is only consulted here;
+    ``ingest_file_from_path`` records files once they have been ingested.
+    """
+    # Work with the plain string form; no ``Path`` objects are needed for metadata.
+    ingestion_result, _ = _build_metadata(os.fspath(path), stat_result, cache)
+    return ingestion_result
+
+
+def _check_readable(path: str) -> None:
+    """Open and close *path* so permission problems surface during ingestion."""
+    os.close(os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)))
+
+
+def ingest_file_from_path(
+    path: str | Path,
+    stat_result: os.stat_result | None = None,
+    cache: FileEntryCache | None = None,
+    include_content: bool = True,
+) -> Dict[str, object]:
+    """Read a local file path and return a normalized ingestion dictionary.
+
+    ``content_bytes`` holds ``bytes`` for small files and a ``LazyFileContent``
+    handle for files larger than ``LAZY_CONTENT_THRESHOLD_BYTES``; ``bytes(...)``
+    works on both. With ``include_content=False`` no content is loaded and
+    ``content_bytes`` is ``None``. New or changed files are recorded in *cache*
+    only after this step succeeds.
+    """
+    path = os.fspath(path)
+    logger.info("Ingesting file at path: %s", path)
+    ingestion_result, stat_result = _build_metadata(path, stat_result, cache)
+
+    # Load the content; downstream processes may turn bytes into chunks.
+    content = _load_content(path, stat_result.st_size) if include_content else None
+    if not isinstance(content, bytes):
+        # Nothing was read yet, so confirm the file can be opened before reporting success.
+        _check_readable(path)
+    ingestion_result["content_bytes"] = content
+
+    # Only new or changed files update the cache, so ``last_ingested_at`` keeps its meaning.
+    if cache is not None and not ingestion_result["unchanged"]:
+        cache.record(path, stat_result, str(ingestion_result["file_id"]))
     logger.info("File %s ingested successfully.", path)
     return ingestion_result
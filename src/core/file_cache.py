@@ -0,0 +1,170 @@
+# -----------------------------------------------------------------------------
+# AI Doc Agent - persistent metadata cache for previously ingested files.
+# -----------------------------------------------------------------------------
+"""Persistent cache of ingestion metadata keyed by file path, mtime, and size.
+
+Entries are stored as JSON under ``logs/.file_cache.json`` so repeated CLI runs
+and Streamlit reruns can recognise files that have not changed since they were
+last ingested and reuse their ``file_id`` instead of treating them as new.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Set
+
+from src.core.logging_utils import project_root
+
+try:  # POSIX advisory locks; Windows falls back to ``msvcrt`` byte-range locks.
+    import fcntl
+except ImportError:  # pragma: no cover - platform specific
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+CACHE_FILE_NAME = ".file_cache.json"
+
+# OS file locks are per process, so threads (e.g. Streamlit sessions) also need this one.
+_SAVE_LOCK = threading.Lock()
+
+
+@contextmanager
+def _exclusive_file_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an OS-level exclusive lock on *lock_path* so processes take turns saving."""
+    with open(lock_path, "a+b") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def default_cache_path() -> Path:
+    """Return the cache location inside the project's ``logs`` directory."""
+    return project_root() / "logs" / CACHE_FILE_NAME
+
+
+class FileEntryCache:
+    """Thread-safe map of absolute path -> ``{mtime_ns, size, file_id, last_ingested_at}``."""
+
+    def __init__(self, cache_path: Path | None = None) -> None:
+        self.cache_path = cache_path if cache_path is not None else default_cache_path()
+        self._entries: Dict[str, Dict[str, object]] = {}
+        self._lock = threading.Lock()
+        # Keys recorded since loading; only these are merged into the file on save.
+        self._dirty_keys: Set[str] = set()
+
+    @classmethod
+    def load(cls, cache_path: Path | None = None) -> "FileEntryCache":
+        """Create a cache populated from disk, starting empty if the file is missing or corrupt."""
+        cache = cls(cache_path)
+        cache._entries = cache._read_entries()
+        logger.debug("Loaded %d cached file entries from %s", len(cache._entries), cache.cache_path)
+        return cache
+
+    def _read_entries(self) -> Dict[str, Dict[str, object]]:
+        """Return the entries currently stored on disk, or an empty dict."""
+        try:
+            with self.cache_path.open("r", encoding="utf-8") as handle:
+                raw_entries = json.load(handle)
+        except FileNotFoundError:
+            logger.debug("No file cache found at %s; starting empty.", self.cache_path)
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable file cache at %s: %s", self.cache_path, exc)
+            return {}
+        return raw_entries if isinstance(raw_entries, dict) else {}
+
+    @staticmethod
+    def _key(path: str | Path) -> str:
+        return os.path.abspath(path)
+
+    def lookup(self, path: str | Path, stat_result: os.stat_result) -> Dict[str, object] | None:
+        """Return the cached entry for *path* if its mtime and size still match."""
+        with self._lock:
+            cached = self._entries.get(self._key(path))
+        if cached is None:
+            return None
+        if cached.get("mtime_ns") != stat_result.st_mtime_ns or cached.get("size") != stat_result.st_size:
+            return None
+        return cached
+
+    def record(self, path: str | Path, stat_result: os.stat_result, file_id: str) -> None:
+        """Store the latest ingestion metadata for *path*."""
+        entry = {
+            "mtime_ns": stat_result.st_mtime_ns,
+            "size": stat_result.st_size,
+            "file_id": file_id,
+            "last_ingested_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        key = self._key(path)
+        with self._lock:
+            self._entries[key] = entry
+            self._dirty_keys.add(key)
+
+    def save(self) -> None:
+        """Merge recorded entries into the on-disk cache and replace it atomically.
+
+        The merge runs under a thread lock plus an OS lock on a sibling ``.lock``
+        file, so entries written by other sessions or processes since this cache
+        was loaded are kept. Entries whose file no longer exists are pruned.
+        Failures are logged rather than raised, since ingestion already succeeded.
+        """
+        with self._lock:
+            if not self._dirty_keys:
+                return
+            updates = {key: self._entries[key] for key in self._dirty_keys}
+
+        tmp_path: str | None = None
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            lock_path = self.cache_path.with_name(f"{self.cache_path.name}.lock")
+            with _SAVE_LOCK, _exclusive_file_lock(lock_path):
+                merged = self._read_entries()
+                merged.update(updates)
+                # Drop entries for deleted files so the cache does not grow without bound.
+                merged = {key: entry for key, entry in merged.items() if os.path.exists(key)}
+
+                # Write to a uniquely named sibling temp file and swap it in so readers
+                # never see a partial file.
+                with tempfile.NamedTemporaryFile(
+                    "w",
+                    encoding="utf-8",
+                    dir=self.cache_path.parent,
+                    prefix=f"{self.cache_path.name}.",
+                    suffix=".tmp",
+                    delete=False,
+                ) as handle:
+                    tmp_path = handle.name
+                    json.dump(merged, handle, indent=2, sort_keys=True)
+                os.replace(tmp_path, self.cache_path)
+                tmp_path = None
+        except OSError as exc:
+            logger.warning("Could not save file cache to %s: %s", self.cache_path, exc)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            return
+
+        with self._lock:
+            self._entries = merged
+            self._dirty_keys.difference_update(updates)
+        logger.debug("Saved file cache to %s", self.cache_path)
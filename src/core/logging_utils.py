@@ -12,15 +12,52 @@ get a run-specific directory and log file that captures everything emitted by
 
 from __future__ import annotations
 
+import atexit
+import functools
 import logging
+import queue
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Tuple
 
 LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
 
+# Machine-readable run summaries go to a dedicated, non-propagating logger whose
+# records land as JSON lines next to the run log.
+SUMMARY_LOGGER_NAME = "ai_doc_agent.summary"
+SUMMARY_FILE_NAME = "summary.jsonl"
 
-def _project_root() -> Path:
+# Background listener that drains queued records into the file/console handlers.
+_LISTENER: QueueListener | None = None
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the ``strftime`` output for records within the same second.
+
+    Output is identical to ``logging.Formatter``; only the per-record ``strftime``
+    call is skipped when consecutive records share a wall-clock second.
+    """
+
+    def __init__(self, fmt: str | None = None) -> None:
+        super().__init__(fmt)
+        self._time_cache: Tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_text = self._time_cache
+        if cached_second != second:
+            cached_text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, cached_text)
+        return self.default_msec_format % (cached_text, record.msecs)
+
+
+@functools.lru_cache(maxsize=1)
+def project_root() -> Path:
     """Return the repository root by traversing up from this file."""
     return Path(__file__).resolve().parents[2]
 
@@ -28,15 +65,30 @@ def _project_root() -> Path:
 def _build_run_log_paths(app_name: str) -> Tuple[Path, Path]:
     """Return the directory and file path for the current logging run."""
     now = datetime.now()
-    date_segment = now.strftime("%Y%m%d")
     run_segment = now.strftime("%Y%m%d_%H%M%S")
+    date_segment = run_segment[:8]
 
-    logs_root = _project_root() / "logs"
+    logs_root = project_root() / "logs"
     run_dir = logs_root / date_segment / f"{app_name}_{run_segment}"
     log_file = run_dir / f"{app_name}_{run_segment}.log"
     return run_dir, log_file
 
 
+def _stop_listener() -> None:
+    """Flush and stop the active queue listener, closing the handlers it owns."""
+    global _LISTENER
+    if _LISTENER is None:
+        return
+
+    _LISTENER.stop()
+    for handler in _LISTENER.handlers:
+        handler.close()
+    _LISTENER = None
+
+
+atexit.register(_stop_listener)
+
+
 def configure_run_logger(app_name: str, level: int = logging.INFO) -> Path:
     """Configure the root logger to emit console + file logs for this run."""
     run_dir, log_file = _build_run_log_paths(app_name)
@@ -48,17 +100,38 @@ def configure_run_logger(app_name: str, level: int = logging.INFO) -> Path:
     for handler in list(root_logger.handlers):
         root_logger.removeHandler(handler)
         handler.close()
+    _stop_listener()
 
     root_logger.setLevel(level)
-    formatter = logging.Formatter(LOG_FORMAT)
+    # Formatting runs on the listener thread; one shared formatter lets the file and
+    # console handlers reuse the cached timestamp for each record.
+    formatter = _CachedTimeFormatter(LOG_FORMAT)
 
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+
+    # Callers only enqueue records; the listener thread performs the blocking writes
+    # so worker threads do not contend on the file/console handler locks.
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    global _LISTENER
+    _LISTENER = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _LISTENER.start()
+
+    # Summary records bypass the root handlers; ``delay`` only creates the file when used.
+    summary_logger = logging.getLogger(SUMMARY_LOGGER_NAME)
+    for handler in list(summary_logger.handlers):
+        summary_logger.removeHandler(handler)
+        handler.close()
+    summary_handler = logging.FileHandler(run_dir / SUMMARY_FILE_NAME, encoding="utf-8", delay=True)
+    summary_handler.setFormatter(logging.Formatter("%(message)s"))
+    summary_logger.addHandler(summary_handler)
+    summary_logger.setLevel(logging.INFO)
+    summary_logger.propagate = False
 
     root_logger.info("Logging initialised; writing file logs to %s", log_file)
     return log_file
@@ -10,10 +10,14 @@ run-scoped logging locations back to the user for easy debugging.
 from __future__ import annotations
 
 import logging
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -22,14 +26,19 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from src.agents.ingestion_agent import (
     DEFAULT_ALLOWED_EXTENSIONS,
+    FileEntry,
     ingest_file_from_path,
     list_input_files,
 )
+from src.core.file_cache import FileEntryCache
 from src.core.logging_utils import configure_run_logger
 
 INPUT_DIR = PROJECT_ROOT / "input"
 LOGGER = logging.getLogger(__name__)
 LOG_APP_NAME = "streamlit_ui"
+FILE_METADATA_COLUMNS = ["name", "extension", "size_bytes", "path"]
+UPLOAD_COPY_CHUNK_BYTES = 1024 * 1024
+MAX_UPLOAD_WORKERS = 8
 
 
 def ensure_input_dir() -> Path:
@@ -42,35 +51,87 @@ def ensure_input_dir() -> Path:
 def save_uploaded_file(uploaded_file: "st.runtime.uploaded_file_manager.UploadedFile") -> Path:
     """Persist the uploaded file to the input directory."""
     destination = ensure_input_dir() / uploaded_file.name
-    destination.write_bytes(uploaded_file.getbuffer())
+    # Stream in 1 MiB chunks rather than materializing the whole upload a second time.
+    uploaded_file.seek(0)
+    with destination.open("wb") as out:
+        shutil.copyfileobj(uploaded_file, out, length=UPLOAD_COPY_CHUNK_BYTES)
     LOGGER.info("Persisted uploaded file to %s", destination)
     return destination
 
 
-def get_existing_files_metadata() -> tuple[List[Dict[str, object]], str | None, bool]:
+def process_upload(
+    uploaded_file: "st.runtime.uploaded_file_manager.UploadedFile",
+    cache: FileEntryCache | None = None,
+) -> Dict[str, object]:
+    """Save and ingest a single upload, returning a success/error summary row."""
+    detail: Dict[str, object] = {"name": uploaded_file.name}
+    try:
+        LOGGER.debug("Saving uploaded file %s", uploaded_file.name)
+        saved_path = save_uploaded_file(uploaded_file)
+        # Only metadata is needed for the summary row, so the payload is never read;
+        # consumers can reopen the file via ``path``.
+        ingestion_result = ingest_file_from_path(saved_path, cache=cache, include_content=False)
+        detail.update({"status": "success", "result": ingestion_result})
+        LOGGER.info("Ingested %s successfully", uploaded_file.name)
+    except (FileNotFoundError, IsADirectoryError, PermissionError) as exc:
+        # Expected filesystem failures do not need a formatted traceback.
+        detail.update({"status": "error", "error": str(exc)})
+        LOGGER.warning("Known ingest failure for %s: %s", uploaded_file.name, exc)
+    except Exception as exc:  # Broad catch to surface errors in the UI.
+        detail.update({"status": "error", "error": str(exc)})
+        LOGGER.exception("Failed to ingest uploaded file %s", uploaded_file.name)
+    return detail
+
+
+def process_uploads(
+    uploaded_files: List["st.runtime.uploaded_file_manager.UploadedFile"],
+    cache: FileEntryCache | None = None,
+) -> List[Dict[str, object]]:
+    """Save and ingest uploads concurrently, returning summary rows in upload order.
+
+    Uploads sharing a file name target the same destination, so each such group is
+    processed sequentially on one worker and the last upload wins, as before.
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, uploaded_file in enumerate(uploaded_files):
+        groups.setdefault(uploaded_file.name, []).append(index)
+
+    def process_group(indices: List[int]) -> List[tuple[int, Dict[str, object]]]:
+        return [(index, process_upload(uploaded_files[index], cache)) for index in indices]
+
+    details: List[Dict[str, object]] = [{} for _ in uploaded_files]
+    with ThreadPoolExecutor(max_workers=min(MAX_UPLOAD_WORKERS, len(groups))) as pool:
+        for group_results in pool.map(process_group, groups.values()):
+            for index, detail in group_results:
+                details[index] = detail
+    return details
+
+
+def get_existing_files_metadata() -> tuple[pd.DataFrame, str | None, bool]:
     """Return current files metadata plus an optional error/info message."""
     try:
-        files: List[Path] = list_input_files(INPUT_DIR)
+        files: List[FileEntry] = list_input_files(INPUT_DIR, sort=True)
     except FileNotFoundError:
         LOGGER.info("Input directory %s is missing; will prompt the user to upload.", INPUT_DIR)
-        return [], "Input folder does not exist yet. Upload a file to create it.", False
+        return pd.DataFrame(columns=FILE_METADATA_COLUMNS), "Input folder does not exist yet. Upload a file to create it.", False
     except NotADirectoryError:
         LOGGER.error("Input path %s exists but is not a directory.", INPUT_DIR)
-        return [], "Configured input path exists but is not a directory.", True
+        return pd.DataFrame(columns=FILE_METADATA_COLUMNS), "Configured input path exists but is not a directory.", True
 
-    metadata = [
+    # Build the frame column-wise; sizes come from the stat results cached during listing.
+    metadata = pd.DataFrame(
         {
-            "name": file.name,
-            "extension": file.suffix.lstrip("."),
-            "size_bytes": file.stat().st_size,
-            "path": str(file),
-        }
-        for file in files
-    ]
+            "name": [file.name for file in files],
+            "extension": [file.extension for file in files],
+            "size_bytes": np.fromiter((file.stat_result.st_size for file in files), dtype=np.int64, count=len(files)),
+            "path": [file.path_str for file in files],
+        },
+        columns=FILE_METADATA_COLUMNS,
+    )
     return metadata, None, False
 
 
-def render_existing_files(files_metadata: List[Dict[str, object]], message: str | None, is_error: bool) -> None:
+def render_existing_files(files_metadata: pd.DataFrame, message: str | None, is_error: bool) -> None:
     """Display the files currently queued for ingestion."""
     st.subheader("Files currently in the input folder")
 
@@ -83,7 +144,7 @@ def render_existing_files(files_metadata: List[Dict[str, object]], message: str
             st.info(message)
         return
 
-    if not files_metadata:
+    if files_metadata.empty:
         LOGGER.info("Existing files view has no supported assets.")
         st.info("No supported files found in the input folder.")
         return
@@ -117,18 +178,10 @@ def main() -> None:
         if uploaded_files:
             with st.spinner("Processing uploads..."):
                 LOGGER.info("Processing %d uploaded file(s).", len(uploaded_files))
-                for uploaded_file in uploaded_files:
-                    detail: Dict[str, object] = {"name": uploaded_file.name}
-                    try:
-                        LOGGER.debug("Saving uploaded file %s", uploaded_file.name)
-                        saved_path = save_uploaded_file(uploaded_file)
-                        ingestion_result = ingest_file_from_path(saved_path)
-                        detail.update({"status": "success", "result": ingestion_result})
-                        LOGGER.info("Ingested %s successfully", uploaded_file.name)
-                    except Exception as exc:  # Broad catch to surface errors in the UI.
-                        detail.update({"status": "error", "error": str(exc)})
-                        LOGGER.exception("Failed to ingest uploaded file %s", uploaded_file.name)
-                    ingestion_details.append(detail)
+                # Saving and ingesting are I/O-bound, so uploads are handled concurrently.
+                cache = FileEntryCache.load()
+                ingestion_details = process_uploads(uploaded_files, cache)
+                cache.save()
 
             st.toast("Upload complete.")
 